@@ -2,10 +2,77 @@
 
 import argparse
 from importlib.resources import files
+from typing import Dict, Iterable, List, Tuple
 from .preprocess.event_processor import EventProcessor
 from .mapping.action_mapper import ActionMapper
 from .mapping.activity_mapper import ActivityMapper
-from .utils import load_json_file, save_to_jsonl_file
+from .mapping.action_grouper import ActionGrouper
+from .utils import load_json_file, save_to_jsonl_file, save_to_jsonl_files, iter_jsonl_file
+
+
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer command-line argument."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'")
+    return number
+
+
+def _pair_mapping_files(
+        parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> List[Tuple[str, str, str, str]]:
+    """
+    Pair each action mapping with the activity mapping and output files at the same position.
+
+    Returns one (action mapping, activity mapping, output actions, output activities) tuple
+    per mapping configuration, falling back to the packaged mappings when none is given.
+    """
+    event_to_action_files = args.custom_action_mapping or [
+        files("ghmap").joinpath("config", "gl_event_to_action.json")
+    ]
+    action_to_activity_files = args.custom_activity_mapping or [
+        files("ghmap").joinpath("config", "gl_action_to_activity.json")
+    ] * len(event_to_action_files)
+    if not (len(event_to_action_files) == len(action_to_activity_files)
+            == len(args.output_actions) == len(args.output_activities)):
+        parser.error("The number of action mappings, activity mappings, output actions "
+                     "and output activities files must match.")
+    return list(zip(
+        event_to_action_files, action_to_activity_files,
+        args.output_actions, args.output_activities
+    ))
+
+
+def _get_platform(action_mappings: List[Dict]) -> str:
+    """Return the platform shared by all action mappings."""
+    platforms = {
+        action_mapping.get('metadata', {}).get('platform', 'GitHub')
+        for action_mapping in action_mappings
+    }
+    if len(platforms) > 1:
+        raise ValueError("All action mappings must target the same platform.")
+    return platforms.pop()
+
+
+def _map_activities(
+        actions: Iterable[Dict],
+        action_to_activity_file: str,
+        output_activities: str,
+        args: argparse.Namespace
+):
+    """Map actions to activities with a single activity mapping and save them."""
+    activity_mapper = ActivityMapper(
+        load_json_file(action_to_activity_file), progress_bar=args.progress_bar
+    )
+    if args.sort_buffer_size:
+        grouper = ActionGrouper(buffer_size=args.sort_buffer_size)
+        activities = activity_mapper.map_groups(grouper.group(actions))
+    else:
+        activities = activity_mapper.map(actions)
+    save_to_jsonl_file(activities, output_activities)
 
 
 def main():
@@ -21,12 +88,14 @@ def main():
     parser.add_argument(
         '--output-actions',
         required=True,
-        help="Path to the output file for mapped actions."
+        nargs='+',
+        help="Path to the output file for mapped actions, one per action mapping."
     )
     parser.add_argument(
         '--output-activities',
         required=True,
-        help="Path to the output file for mapped activities."
+        nargs='+',
+        help="Path to the output file for mapped activities, one per activity mapping."
     )
     parser.add_argument(
         '--actors-to-remove',
@@ -54,29 +123,33 @@ def main():
     )
     parser.add_argument(
         '--custom-action-mapping',
+        nargs='+',
         default=None,
-        help='Path to a custom event to action mapping JSON file.'
+        help='Path to one or more custom event to action mapping JSON files.'
     )
     parser.add_argument(
         '--custom-activity-mapping',
+        nargs='+',
+        default=None,
+        help='Path to one or more custom action to activity mapping JSON files.'
+    )
+    parser.add_argument(
+        '--sort-buffer-size',
+        type=_positive_int,
         default=None,
-        help='Path to a custom action to activity mapping JSON file.'
+        help="Group actions with an on-disk external sort, keeping at most this many "
+             "actions in memory per sorted run."
     )
     args = parser.parse_args()
+    pipelines = _pair_mapping_files(parser, args)
 
     try:
-        # Load Event to Action Mapping to get metadata information
-        if args.custom_action_mapping:
-            event_to_action_file = args.custom_action_mapping
-        else:
-            event_to_action_file = files("ghmap").joinpath("config", "gl_event_to_action.json")
-        action_mapping = load_json_file(event_to_action_file)
-
-        platform = action_mapping.get('metadata', {}).get('platform', 'GitHub')
+        # Load Event to Action Mappings to get metadata information
+        action_mappings = [load_json_file(pipeline[0]) for pipeline in pipelines]
 
         # Step 0: Event Preprocessing
         print("Step 0: Preprocessing events...")
-        processor = EventProcessor(platform, progress_bar=args.progress_bar)
+        processor = EventProcessor(_get_platform(action_mappings), progress_bar=args.progress_bar)
         events = processor.process(
             args.raw_events,
             args.actors_to_remove,
@@ -84,23 +157,27 @@ def main():
             args.orgs_to_remove
         )
 
-        # Step 1: Event to Action Mapping
-        action_mapper = ActionMapper(action_mapping, progress_bar=args.progress_bar)
-        actions = action_mapper.map(events)
-        save_to_jsonl_file(actions, args.output_actions)
-        print(f"Step 1 completed. Actions saved to: {args.output_actions}")
+        # Step 1: Event to Action Mapping, a single pass over the events for all mappings
+        action_mapper = ActionMapper(action_mappings, progress_bar=args.progress_bar)
+        if args.sort_buffer_size:
+            # Stream actions straight to disk and read them back lazily in Step 2,
+            # so that they are never all held in memory at once
+            save_to_jsonl_files(action_mapper.iter_map_all(events), args.output_actions)
+            all_actions = [iter_jsonl_file(path) for path in args.output_actions]
+        else:
+            all_actions = action_mapper.map_all(events)
+            for actions, output_actions in zip(all_actions, args.output_actions):
+                save_to_jsonl_file(actions, output_actions)
+        del events
+        for output_actions in args.output_actions:
+            print(f"Step 1 completed. Actions saved to: {output_actions}")
 
         # Step 2: Action to Activity Mapping
-        if args.custom_activity_mapping:
-            action_to_activity_file = args.custom_activity_mapping
-        else:
-            action_to_activity_file = (files("ghmap")
-                                       .joinpath("config", "gl_action_to_activity.json"))
-        activity_mapping = load_json_file(action_to_activity_file)
-        activity_mapper = ActivityMapper(activity_mapping, progress_bar=args.progress_bar)
-        activities = activity_mapper.map(actions)
-        save_to_jsonl_file(activities, args.output_activities)
-        print(f"Step 2 completed. Activities saved to: {args.output_activities}")
+        for actions, (_, action_to_activity_file, _, output_activities) in zip(
+                all_actions, pipelines
+        ):
+            _map_activities(actions, action_to_activity_file, output_activities, args)
+            print(f"Step 2 completed. Activities saved to: {output_activities}")
 
     except Exception as e:  # pylint: disable=broad-exception-caught
         print(f"An error occurred: {e}")
@@ -0,0 +1,148 @@
+"""Action Grouper: streams actions grouped by actor and repository using an external sort."""
+
+import heapq
+import pickle
+import tempfile
+from contextlib import ExitStack
+from itertools import groupby, islice
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class ActionGrouper: # pylint: disable=too-few-public-methods
+    """
+    A class to group actions by (actor, repository), ordered by date, without holding
+    the whole dataset in memory.
+
+    Actions are buffered into sorted runs that are spilled to temporary files as
+    pickled records, then k-way merged by (actor id, repository id, date). Runs are merged
+    in batches of at most `max_fan_in` files, so that the number of open files stays bounded.
+
+    Attributes:
+        buffer_size (int): Maximum number of actions sorted in memory per run.
+        presorted (bool): Whether the input is already ordered by (actor, repository, date),
+            in which case no sorting nor spilling is performed. Actions produced by
+            `ActionMapper` follow the event order, so this is only useful for inputs
+            sorted beforehand.
+        temp_dir (Optional[str]): Directory in which the temporary run files are created.
+        max_fan_in (int): Maximum number of run files merged at once.
+    """
+
+    def __init__(
+            self,
+            buffer_size: int = 100_000,
+            presorted: bool = False,
+            temp_dir: Optional[str] = None,
+            max_fan_in: int = 64
+    ):
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be a positive integer.")
+        if max_fan_in < 2:
+            raise ValueError("max_fan_in must be at least 2.")
+        self.buffer_size = buffer_size
+        self.presorted = presorted
+        self.temp_dir = temp_dir
+        self.max_fan_in = max_fan_in
+
+    @staticmethod
+    def _id_key(value: Any) -> Tuple[bool, Any]:
+        """Orders missing ids after all others so that ids never get compared to None."""
+        return value is None, 0 if value is None else value
+
+    @staticmethod
+    def _sort_key(item: Tuple[int, Dict]) -> Tuple[Tuple[bool, Any], Tuple[bool, Any], str]:
+        action = item[1]
+        return (
+            ActionGrouper._id_key(action["actor"]["id"]),
+            ActionGrouper._id_key(action["repository"]["id"]),
+            action["date"]
+        )
+
+    @staticmethod
+    def _group_key(item: Tuple[int, Dict]) -> Tuple[Any, Any]:
+        action = item[1]
+        return action["actor"]["id"], action["repository"]["id"]
+
+    def _write_run(self, items: List[Tuple[int, Dict]], stack: ExitStack) -> BinaryIO:
+        """Sorts a chunk of indexed actions and spills it to a temporary file."""
+        items.sort(key=self._sort_key)
+        run_file = stack.enter_context(tempfile.TemporaryFile(dir=self.temp_dir))
+        for item in items:
+            pickle.dump(item, run_file, protocol=pickle.HIGHEST_PROTOCOL)
+        run_file.seek(0)
+        return run_file
+
+    @staticmethod
+    def _read_run(run_file: BinaryIO) -> Iterator[Tuple[int, Dict]]:
+        """Reads back the indexed actions of a sorted run, one at a time."""
+        while True:
+            try:
+                yield pickle.load(run_file)
+            except EOFError:
+                return
+
+    def _merge_runs(self, runs: List[BinaryIO], stack: ExitStack) -> BinaryIO:
+        """Merges sorted runs into a single larger run file and closes the merged ones."""
+        run_file = stack.enter_context(tempfile.TemporaryFile(dir=self.temp_dir))
+        # heapq.merge is stable across runs, so equal dates keep their input order
+        for item in heapq.merge(*(self._read_run(run) for run in runs), key=self._sort_key):
+            pickle.dump(item, run_file, protocol=pickle.HIGHEST_PROTOCOL)
+        for run in runs:
+            run.close()
+        run_file.seek(0)
+        return run_file
+
+    def _add_run(self, levels: List[List[BinaryIO]], run: BinaryIO, stack: ExitStack):
+        """
+        Adds a run to the merge levels, in input order. A level reaching `max_fan_in` runs is
+        merged into a single run appended to the next level.
+        """
+        for level in levels:
+            level.append(run)
+            if len(level) < self.max_fan_in:
+                return
+            run = self._merge_runs(level, stack)
+            level.clear()
+        levels.append([run])
+
+    def _sorted_actions(
+            self, items: Iterator[Tuple[int, Dict]], stack: ExitStack
+    ) -> Iterator[Tuple[int, Dict]]:
+        """Returns the indexed actions ordered by (actor, repository, date)."""
+        chunk = list(islice(items, self.buffer_size))
+
+        # Everything fits in a single run: no need to go through the disk
+        if len(chunk) < self.buffer_size:
+            chunk.sort(key=self._sort_key)
+            return iter(chunk)
+
+        levels = []
+        while chunk:
+            run = self._write_run(chunk, stack)
+            # Release the spilled actions before reading the next chunk
+            chunk.clear()
+            self._add_run(levels, run, stack)
+            chunk = list(islice(items, self.buffer_size))
+
+        # Higher levels hold the earliest actions
+        runs = [run for level in reversed(levels) for run in level]
+        while len(runs) > self.max_fan_in:
+            runs = [
+                self._merge_runs(runs[start:start + self.max_fan_in], stack)
+                for start in range(0, len(runs), self.max_fan_in)
+            ]
+
+        # heapq.merge is stable across runs, so equal dates keep their input order
+        return heapq.merge(*(self._read_run(run) for run in runs), key=self._sort_key)
+
+    def group(self, actions: Iterable[Dict]) -> Iterator[Tuple[int, List[Dict]]]:
+        """
+        Yields the actions of each (actor, repository) pair as a list sorted by date, along with
+        the input position of the first action of the group.
+        """
+        with ExitStack() as stack:
+            items = enumerate(actions)
+            if not self.presorted:
+                items = self._sorted_actions(items, stack)
+            for _, group in groupby(items, key=self._group_key):
+                group = list(group)
+                yield min(index for index, _ in group), [action for _, action in group]
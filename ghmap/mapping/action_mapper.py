@@ -3,7 +3,7 @@
 import json
 import re
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Iterable, Iterator
 from tqdm import tqdm
 
 
@@ -11,19 +11,46 @@ class ActionMapper: # pylint: disable=too-few-public-methods
     """
     A class to map events to high-level actions based on predefined event types and conditions.
 
+    Several mapping configurations can be given at once: events are then decoded a single time
+    and rules shared between configurations are only evaluated once per event.
+
     Attributes:
-        action_mapping (Dict): Predefined mapping of actions and event rules.
+        action_mappings (List[Dict]): Predefined mappings of actions and event rules.
+        action_mapping (Dict): The first (or only) mapping of actions and event rules.
         event_type_key (str): Key to identify the event type in the event record.
         created_at_key (str): Key to identify the creation date in the event record.
         progress_bar (bool): Flag to enable or disable progress bar (tqdm).
     """
 
-    def __init__(self, action_mapping: Dict, progress_bar: bool = True):
-        self.action_mapping = action_mapping
-        parameters = action_mapping.get('parameters', {})
-        self.event_type_key = parameters.get('event_type_key', 'type')
-        self.created_at_key = parameters.get('created_at_key', 'created_at')
+    def __init__(self, action_mapping: Dict | List[Dict], progress_bar: bool = True):
+        if isinstance(action_mapping, dict):
+            action_mapping = [action_mapping]
+        if not action_mapping:
+            raise ValueError("At least one action mapping is required.")
+        self.action_mappings = action_mapping
+        self.action_mapping = action_mapping[0]
+        self.event_type_key, self.created_at_key = self._get_keys(self.action_mapping)
         self.progress_bar = progress_bar
+        self._rule_keys = [self._build_rule_keys(mapping) for mapping in action_mapping]
+
+    @staticmethod
+    def _get_keys(action_mapping: Dict) -> Tuple[str, str]:
+        """Returns the event type and creation date keys of a mapping configuration."""
+        parameters = action_mapping.get('parameters', {})
+        return (
+            parameters.get('event_type_key', 'type'),
+            parameters.get('created_at_key', 'created_at')
+        )
+
+    def _build_rule_keys(self, action_mapping: Dict) -> Dict[str, Tuple[str, str, str]]:
+        """Builds a hashable key per action rule, identical for rules shared across mappings."""
+        event_type_key, created_at_key = self._get_keys(action_mapping)
+        return {
+            action_name: (
+                event_type_key, created_at_key, json.dumps(action_details['event'], sort_keys=True)
+            )
+            for action_name, action_details in action_mapping['actions'].items()
+        }
 
     @staticmethod
     def _deserialize_payload(event_record: Dict) -> Dict:
@@ -32,18 +59,19 @@ class ActionMapper: # pylint: disable=too-few-public-methods
             event_record['payload'] = json.loads(event_record['payload'])
         return event_record
 
-    def _convert_date_to_iso(self, event_record: Dict) -> Dict:
+    @staticmethod
+    def _convert_date_to_iso(event_record: Dict, created_at_key: str) -> Dict:
         """Converts 'created_at' to ISO 8601 format if it's a Unix timestamp or string."""
-        created_at = event_record.get(self.created_at_key)
+        created_at = event_record.get(created_at_key)
         if isinstance(created_at, str):
             # If the date has milliseconds, remove them
             if '.' in created_at:
                 created_at = created_at.split('.')[0] + "Z"
-            event_record[self.created_at_key] = datetime.strptime(
+            event_record[created_at_key] = datetime.strptime(
                 created_at, '%Y-%m-%dT%H:%M:%SZ'
             ).strftime('%Y-%m-%dT%H:%M:%SZ')
         elif isinstance(created_at, int):
-            event_record[self.created_at_key] = datetime.utcfromtimestamp(
+            event_record[created_at_key] = datetime.utcfromtimestamp(
                 created_at / 1000
             ).strftime('%Y-%m-%dT%H:%M:%SZ')
         return event_record
@@ -73,16 +101,14 @@ class ActionMapper: # pylint: disable=too-few-public-methods
         return event_value == mapping_value
 
     def _extract_attributes(
-        self, event_record: Dict, action_details: Dict, action_name: str
+        self, event_record: Dict, action_details: Dict, action_name: str, common_fields: Dict
     ) -> Dict:
         """Extracts attributes and common fields from the event record."""
         mapped_action = {'action': action_name}
 
         if action_details['attributes'].get('include_common_fields'):
             mapped_action.update(
-                self._extract_fields(
-                    event_record, self.action_mapping['common_fields']
-                )
+                self._extract_fields(event_record, common_fields)
             )
 
         mapped_action['details'] = self._extract_fields(
@@ -136,37 +162,100 @@ class ActionMapper: # pylint: disable=too-few-public-methods
                 return None
         return value
 
-    def map(self, events: List[Dict]) -> List[Dict]:
-        """Maps events to high-level actions using mapping configuration."""
-        all_mapped_actions = []
+    def _match_rule(self, event_record: Dict, event_type: Any, event_rule: Dict) -> bool:
+        """Checks whether the event record matches the event rule of an action."""
+        return (
+            event_type == event_rule.get('type', None)
+            and all(
+                self._match_condition(
+                    self._extract_field(event_record, k), v
+                )
+                for k, v in event_rule.items() if k != 'type'
+            )
+        )
+
+    def _map_event( # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        event_record: Dict,
+        action_mapping: Dict,
+        rule_keys: Dict[str, Tuple[str, str, str]],
+        event_type: Any,
+        rule_results: Dict | None
+    ) -> Dict:
+        """Maps an event record to an action using a single mapping configuration."""
+        for action_name, action_details in action_mapping['actions'].items():
+            event_rule = action_details['event']
+            if rule_results is None:
+                matched = self._match_rule(event_record, event_type, event_rule)
+            else:
+                rule_key = rule_keys[action_name]
+                matched = rule_results.get(rule_key)
+                if matched is None:
+                    matched = self._match_rule(event_record, event_type, event_rule)
+                    rule_results[rule_key] = matched
+            if matched:
+                return self._extract_attributes(
+                    event_record, action_details, action_name, action_mapping['common_fields']
+                )
+
+        return self._extract_attributes(
+            event_record,
+            action_mapping['actions']['UnknownAction'],
+            'UnknownAction',
+            action_mapping['common_fields']
+        )
+
+    def iter_map_all(self, events: Iterable[Dict]) -> Iterator[List[Dict]]:
+        """
+        Maps events to high-level actions using every mapping configuration in a single pass.
+
+        Yields, for each event, the list of its actions under each mapping configuration,
+        in the order the configurations were given.
+        """
+        mapping_keys = [self._get_keys(action_mapping) for action_mapping in self.action_mappings]
+        # The date can only be converted in place when every mapping expects the same field
+        shared_created_at_key = len({keys[1] for keys in mapping_keys}) == 1
+        # Rule results are only worth caching when several configurations may share rules
+        share_rules = len(self.action_mappings) > 1
 
         for event_record in tqdm(events, desc="Mapping events to actions", unit="event", disable=not self.progress_bar): # pylint: disable=line-too-long
             if 'payload' in event_record:
                 event_record = self._deserialize_payload(event_record)
-            event_record = self._convert_date_to_iso(event_record)
-            event_type = self._extract_field(event_record, self.event_type_key)
-
-            for action_name, action_details in self.action_mapping['actions'].items():
-                if (
-                    event_type == action_details['event'].get('type', None)
-                    and all(
-                        self._match_condition(
-                            self._extract_field(event_record, k), v
-                        )
-                        for k, v in action_details['event'].items() if k != 'type'
-                    )
-                ):
-                    mapped_action = self._extract_attributes(
-                        event_record, action_details, action_name
-                    )
-                    all_mapped_actions.append(mapped_action)
-                    break
-            else:
-                mapped_action = self._extract_attributes(
-                    event_record,
-                    self.action_mapping['actions']['UnknownAction'],
-                    'UnknownAction'
-                )
-                all_mapped_actions.append(mapped_action)
+            if shared_created_at_key:
+                event_record = self._convert_date_to_iso(event_record, mapping_keys[0][1])
+            rule_results = {} if share_rules else None
+
+            event_actions = []
+            for action_mapping, rule_keys, (event_type_key, created_at_key) in zip(
+                    self.action_mappings, self._rule_keys, mapping_keys
+            ):
+                mapping_record = event_record
+                if not shared_created_at_key:
+                    # Only convert this mapping's own date field, as a standalone run would
+                    mapping_record = self._convert_date_to_iso(dict(event_record), created_at_key)
+                event_actions.append(self._map_event(
+                    mapping_record,
+                    action_mapping,
+                    rule_keys,
+                    self._extract_field(mapping_record, event_type_key),
+                    rule_results
+                ))
+            yield event_actions
+
+    def map_all(self, events: List[Dict]) -> List[List[Dict]]:
+        """
+        Maps events to high-level actions using every mapping configuration in a single pass.
 
+        Returns one list of actions per mapping configuration, in the order they were given.
+        """
+        all_mapped_actions = [[] for _ in self.action_mappings]
+        for event_actions in self.iter_map_all(events):
+            for mapped_actions, mapped_action in zip(all_mapped_actions, event_actions):
+                mapped_actions.append(mapped_action)
         return all_mapped_actions
+
+    def map(self, events: List[Dict]) -> List[Dict]:
+        """Maps events to high-level actions using mapping configuration."""
+        if len(self.action_mappings) > 1:
+            raise ValueError("Several action mappings are configured, use map_all instead.")
+        return self.map_all(events)[0]
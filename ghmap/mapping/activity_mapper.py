@@ -1,7 +1,7 @@
 """Module to map GitHub actions to higher-level activities based on rules."""
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Iterable
 from tqdm import tqdm
 
 
@@ -124,10 +124,21 @@ class ActivityMapper: # pylint: disable=too-few-public-methods
 
     def map(self, actions: List[Dict]) -> List[Dict]:
         """Map actions to activities based on activity mapping configuration."""
-        grouped = self._group_actions(actions)
+        return self.map_groups(enumerate(self._group_actions(actions).values()))
+
+    def map_groups(self, groups: Iterable[Tuple[int, List[Dict]]]) -> List[Dict]:
+        """
+        Map groups of actions to activities, consuming one group at a time.
+
+        Each group is an (order, actions) pair, as produced by `ActionGrouper.group`: the actions
+        of a single (actor, repository) pair sorted by date, and the position at which the group
+        first appears in the input, used to order activities sharing the same start date.
+        """
         all_mapped_activities = []
+        seen_ids = set()
 
-        for actions_group in tqdm(grouped.values(), desc="Mapping actions to activities", unit="group", disable=not self.progress_bar): # pylint: disable=line-too-long
+        for group_order, actions_group in tqdm(groups, desc="Mapping actions to activities", unit="group", disable=not self.progress_bar): # pylint: disable=line-too-long
+            seen_ids.update(a["event_id"] for a in actions_group)
             i = 0
             while i < len(actions_group):
                 if actions_group[i]["event_id"] in self.used_ids:
@@ -137,7 +148,7 @@ class ActivityMapper: # pylint: disable=too-few-public-methods
                 for activity in self.activity_mapping["activities"]:
                     gathered, _, _ = self._gather_actions(actions_group, i, activity)
                     if gathered:
-                        all_mapped_activities.append({
+                        all_mapped_activities.append((group_order, {
                             "activity": activity["name"],
                             "start_date": gathered[0]["date"],
                             "end_date": gathered[-1]["date"],
@@ -147,7 +158,7 @@ class ActivityMapper: # pylint: disable=too-few-public-methods
                                 {k: a[k] for k in ("action", "event_id", "date", "details")}
                                 for a in gathered
                             ]
-                        })
+                        }))
                         self.used_ids.update(a["event_id"] for a in gathered)
                         actions_group = [
                             a for a in actions_group if a["event_id"] not in self.used_ids
@@ -157,12 +168,11 @@ class ActivityMapper: # pylint: disable=too-few-public-methods
                 else:
                     i += 1
 
-        unused_ids = {
-            a["event_id"] for group in grouped.values() for a in group
-        } - self.used_ids
+        unused_ids = seen_ids - self.used_ids
 
         if unused_ids:
             print(f"Warning: Unused actions: {unused_ids}")
 
-        all_mapped_activities.sort(key=lambda x: x["start_date"])
-        return all_mapped_activities
+        # Activities of different groups sharing a start date follow the groups' input order
+        all_mapped_activities.sort(key=lambda x: (x[1]["start_date"], x[0]))
+        return [activity for _, activity in all_mapped_activities]
@@ -1,12 +1,19 @@
 """Utility functions for loading and saving JSON/JSONL files."""
 
 import json
+from contextlib import ExitStack
 
 def load_jsonl_file(file_path):
     """Load actions from a JSON Lines file."""
     with open(file_path, 'r', encoding='utf-8') as file:
         return [json.loads(line) for line in file]
 
+def iter_jsonl_file(file_path):
+    """Lazily load items from a JSON Lines file, one line at a time."""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            yield json.loads(line)
+
 def load_json_file(file_path):
     """Load a JSON file."""
     with open(file_path, 'r', encoding='utf-8') as file:
@@ -18,3 +25,12 @@ def save_to_jsonl_file(data, file_path):
         for item in data:
             json.dump(item, file)
             file.write('\n')
+
+def save_to_jsonl_files(rows, file_paths):
+    """Save rows of data to several JSON Lines files, the i-th item of each row to the i-th file."""
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(path, 'w', encoding='utf-8')) for path in file_paths]
+        for row in rows:
+            for item, file in zip(row, files):
+                json.dump(item, file)
+                file.write('\n')
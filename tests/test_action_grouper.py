@@ -0,0 +1,135 @@
+"""Test the external sort grouping of actions by actor and repository."""
+
+import pytest
+
+from ghmap.mapping.action_grouper import ActionGrouper
+from ghmap.mapping.activity_mapper import ActivityMapper
+
+
+def make_action(event_id, actor_id, repo_id, date, action="PushCommits"):
+    """Build a minimal action record."""
+    return {
+        "action": action,
+        "event_id": event_id,
+        "date": date,
+        "actor": {"id": actor_id},
+        "repository": {"id": repo_id},
+        "details": {}
+    }
+
+
+def test_group_merges_runs_by_actor_repository_and_date():
+    """Actions spread over several spilled runs are merged into sorted groups."""
+    actions = [
+        make_action(1, 2, 1, "2024-01-03T00:00:00Z"),
+        make_action(2, 1, 1, "2024-01-02T00:00:00Z"),
+        make_action(3, 2, 1, "2024-01-01T00:00:00Z"),
+        make_action(4, 1, 2, "2024-01-01T00:00:00Z"),
+        make_action(5, 1, 1, "2024-01-01T00:00:00Z"),
+    ]
+
+    groups = list(ActionGrouper(buffer_size=2).group(actions))
+
+    assert [[a["event_id"] for a in group] for _, group in groups] == [[5, 2], [4], [3, 1]]
+    assert [order for order, _ in groups] == [1, 3, 0]
+
+
+def test_group_keeps_input_order_for_equal_dates_across_runs():
+    """Actions of a group sharing a date keep their input order, even across runs."""
+    actions = [make_action(i, 1, 1, "2024-01-01T00:00:00Z") for i in range(7)]
+
+    groups = list(ActionGrouper(buffer_size=2).group(actions))
+
+    assert [[a["event_id"] for a in group] for _, group in groups] == [list(range(7))]
+
+
+def test_group_handles_missing_ids():
+    """Actions without actor or repository id are grouped after the others."""
+    actions = [
+        make_action(1, 1, None, "2024-01-01T00:00:00Z"),
+        make_action(2, None, 1, "2024-01-01T00:00:00Z"),
+        make_action(3, 1, 1, "2024-01-01T00:00:00Z"),
+        make_action(4, 1, None, "2024-01-02T00:00:00Z"),
+    ]
+
+    groups = list(ActionGrouper(buffer_size=2).group(actions))
+
+    assert [[a["event_id"] for a in group] for _, group in groups] == [[3], [1, 4], [2]]
+
+
+def test_group_presorted_input():
+    """Presorted input is grouped as is, without being sorted."""
+    actions = [
+        make_action(1, 2, 1, "2024-01-02T00:00:00Z"),
+        make_action(2, 2, 1, "2024-01-01T00:00:00Z"),
+        make_action(3, 1, 1, "2024-01-01T00:00:00Z"),
+    ]
+
+    groups = list(ActionGrouper(presorted=True).group(actions))
+
+    assert [[a["event_id"] for a in group] for _, group in groups] == [[1, 2], [3]]
+    assert [order for order, _ in groups] == [0, 2]
+
+
+@pytest.mark.parametrize("buffer_size", [0, -1])
+def test_invalid_buffer_size(buffer_size):
+    """A buffer size lower than one is rejected."""
+    with pytest.raises(ValueError):
+        ActionGrouper(buffer_size=buffer_size)
+
+
+@pytest.mark.parametrize("max_fan_in", [1, 0])
+def test_invalid_max_fan_in(max_fan_in):
+    """A fan-in lower than two is rejected."""
+    with pytest.raises(ValueError):
+        ActionGrouper(max_fan_in=max_fan_in)
+
+
+def test_activities_order_matches_in_memory_grouping():
+    """Activities sharing a start date are ordered the same with and without the grouper."""
+    activity_mapping = {
+        "activities": [{
+            "name": "PushCommits",
+            "time_window": "0s",
+            "actions": [{"action": "PushCommits"}]
+        }]
+    }
+    actions = [
+        make_action(1, 2, 1, "2024-01-01T00:00:00Z"),
+        make_action(2, 1, 1, "2024-01-01T00:00:00Z"),
+        make_action(3, None, 1, "2024-01-01T00:00:00Z"),
+    ]
+
+    in_memory = ActivityMapper(
+        {"activities": [dict(a) for a in activity_mapping["activities"]]}, progress_bar=False
+    ).map(actions)
+    grouped = ActivityMapper(
+        {"activities": [dict(a) for a in activity_mapping["activities"]]}, progress_bar=False
+    ).map_groups(ActionGrouper(buffer_size=1).group(actions))
+
+    assert [a["actor"]["id"] for a in in_memory] == [2, 1, None]
+    assert grouped == in_memory
+
+
+def test_activities_match_in_memory_grouping_beyond_max_fan_in():
+    """Runs merged in several passes give the same activities as the in-memory grouping."""
+    activity_mapping = {
+        "activities": [{
+            "name": "PushCommits",
+            "time_window": "3600s",
+            "actions": [{"action": "PushCommits", "repeat": True}]
+        }]
+    }
+    actions = [
+        make_action(i, [2, 1, None][i % 3], i % 2, f"2024-01-0{1 + i % 4}T00:00:00Z")
+        for i in range(50)
+    ]
+
+    in_memory = ActivityMapper(
+        {"activities": [dict(a) for a in activity_mapping["activities"]]}, progress_bar=False
+    ).map(actions)
+    grouped = ActivityMapper(
+        {"activities": [dict(a) for a in activity_mapping["activities"]]}, progress_bar=False
+    ).map_groups(ActionGrouper(buffer_size=2, max_fan_in=3).group(actions))
+
+    assert grouped == in_memory
@@ -0,0 +1,47 @@
+"""Test mapping events with several action mappings in a single pass."""
+
+import copy
+
+from ghmap.mapping.action_mapper import ActionMapper
+
+
+def make_mapping(created_at_key, action_name):
+    """Build a minimal action mapping reading its date from the given field."""
+    return {
+        "parameters": {"event_type_key": "type", "created_at_key": created_at_key},
+        "common_fields": {"event_id": "id", "date": created_at_key},
+        "actions": {
+            action_name: {
+                "event": {"type": "PushEvent"},
+                "attributes": {
+                    "include_common_fields": True,
+                    "details": {"created_at": "created_at", "updated_at": "updated_at"}
+                }
+            },
+            "UnknownAction": {
+                "event": {},
+                "attributes": {"include_common_fields": True, "details": {}}
+            }
+        }
+    }
+
+
+def test_map_all_matches_standalone_runs():
+    """Each mapping gives the same actions as when it is run on its own."""
+    events = [
+        {"id": 1, "type": "PushEvent", "payload": "{}",
+         "created_at": "2024-01-01T00:00:00.123Z", "updated_at": 1704067200000},
+        {"id": 2, "type": "IssuesEvent", "payload": {},
+         "created_at": 1704067200000, "updated_at": "2024-01-02T00:00:00.5Z"},
+    ]
+    mappings = [make_mapping("created_at", "PushA"), make_mapping("updated_at", "PushB")]
+
+    standalone = [
+        ActionMapper(mapping, progress_bar=False).map(copy.deepcopy(events))
+        for mapping in mappings
+    ]
+    combined = ActionMapper(mappings, progress_bar=False).map_all(copy.deepcopy(events))
+
+    assert combined == standalone
+    assert [a["action"] for a in combined[0]] == ["PushA", "UnknownAction"]
+    assert [a["action"] for a in combined[1]] == ["PushB", "UnknownAction"]
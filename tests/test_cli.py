@@ -56,3 +56,114 @@ def test_ghmap_cli_customized_mapping():
             os.path.join(sample_dir, "expected-activities.jsonl"),
             shallow=False
         ), "Activities output does not match expected"
+
+def test_ghmap_cli_external_sort_grouping():
+    """Run the ghmap CLI with on-disk grouping and compare activities to expected results."""
+    sample_dir = os.path.join(os.path.dirname(__file__), "data")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        subprocess.run([
+            "python", "-m", "ghmap.cli",
+            "--raw-events", os.path.join(sample_dir, "custom-sample-events.json"),
+            "--output-actions", os.path.join(tmpdir, "actions.jsonl"),
+            "--output-activities", os.path.join(tmpdir, "activities.jsonl"),
+            "--sort-buffer-size", "3"
+        ], check=True)
+
+        assert filecmp.cmp(
+            os.path.join(tmpdir, "activities.jsonl"),
+            os.path.join(sample_dir, "custom-expected-activities.jsonl"),
+            shallow=False
+        ), "Activities output does not match expected"
+
+def test_ghmap_cli_multiple_mappings():
+    """Run the ghmap CLI with several mappings at once and compare each output to expected."""
+    sample_dir = os.path.join(os.path.dirname(__file__), "data")
+    config_dir = os.path.join(os.path.dirname(__file__), "..", "ghmap", "config")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        subprocess.run([
+            "python", "-m", "ghmap.cli",
+            "--raw-events", os.path.join(sample_dir, "sample-events.json"),
+            "--output-actions",
+            os.path.join(tmpdir, "actions.jsonl"), os.path.join(tmpdir, "issue-actions.jsonl"),
+            "--output-activities",
+            os.path.join(tmpdir, "activities.jsonl"),
+            os.path.join(tmpdir, "issue-activities.jsonl"),
+            "--custom-action-mapping",
+            os.path.join(config_dir, "event_to_action.json"),
+            os.path.join(sample_dir, "issue-event-to-action.json"),
+            "--custom-activity-mapping",
+            os.path.join(config_dir, "action_to_activity.json"),
+            os.path.join(sample_dir, "issue-action-to-activity.json")
+        ], check=True)
+
+        for output, expected in (
+                ("actions.jsonl", "expected-actions.jsonl"),
+                ("activities.jsonl", "expected-activities.jsonl"),
+                ("issue-actions.jsonl", "issue-expected-actions.jsonl"),
+                ("issue-activities.jsonl", "issue-expected-activities.jsonl"),
+        ):
+            assert filecmp.cmp(
+                os.path.join(tmpdir, output),
+                os.path.join(sample_dir, expected),
+                shallow=False
+            ), f"{output} does not match expected"
+
+def test_ghmap_cli_mismatched_mapping_counts():
+    """Run the ghmap CLI with fewer output files than mappings and check it is rejected."""
+    sample_dir = os.path.join(os.path.dirname(__file__), "data")
+    config_dir = os.path.join(os.path.dirname(__file__), "..", "ghmap", "config")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        result = subprocess.run([
+            "python", "-m", "ghmap.cli",
+            "--raw-events", os.path.join(sample_dir, "sample-events.json"),
+            "--output-actions", os.path.join(tmpdir, "actions.jsonl"),
+            "--output-activities", os.path.join(tmpdir, "activities.jsonl"),
+            "--custom-action-mapping",
+            os.path.join(config_dir, "event_to_action.json"),
+            os.path.join(sample_dir, "issue-event-to-action.json")
+        ], capture_output=True, text=True, check=False)
+
+        assert result.returncode == 2
+        assert "must match" in result.stderr
+        assert not os.path.exists(os.path.join(tmpdir, "actions.jsonl"))
+
+def test_ghmap_cli_mixed_platform_mappings():
+    """Run the ghmap CLI with GitHub and GitLab mappings together and check it is rejected."""
+    sample_dir = os.path.join(os.path.dirname(__file__), "data")
+    config_dir = os.path.join(os.path.dirname(__file__), "..", "ghmap", "config")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        result = subprocess.run([
+            "python", "-m", "ghmap.cli",
+            "--raw-events", os.path.join(sample_dir, "sample-events.json"),
+            "--output-actions",
+            os.path.join(tmpdir, "actions-1.jsonl"), os.path.join(tmpdir, "actions-2.jsonl"),
+            "--output-activities",
+            os.path.join(tmpdir, "activities-1.jsonl"), os.path.join(tmpdir, "activities-2.jsonl"),
+            "--custom-action-mapping",
+            os.path.join(config_dir, "event_to_action.json"),
+            os.path.join(config_dir, "gl_event_to_action.json")
+        ], capture_output=True, text=True, check=False)
+
+        assert "All action mappings must target the same platform" in result.stdout
+        assert not os.path.exists(os.path.join(tmpdir, "actions-1.jsonl"))
+
+def test_ghmap_cli_invalid_sort_buffer_size():
+    """Run the ghmap CLI with a non positive sort buffer size and check it is rejected."""
+    sample_dir = os.path.join(os.path.dirname(__file__), "data")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        result = subprocess.run([
+            "python", "-m", "ghmap.cli",
+            "--raw-events", os.path.join(sample_dir, "custom-sample-events.json"),
+            "--output-actions", os.path.join(tmpdir, "actions.jsonl"),
+            "--output-activities", os.path.join(tmpdir, "activities.jsonl"),
+            "--sort-buffer-size", "0"
+        ], capture_output=True, text=True, check=False)
+
+        assert result.returncode == 2
+        assert "--sort-buffer-size" in result.stderr
+        assert not os.path.exists(os.path.join(tmpdir, "actions.jsonl"))